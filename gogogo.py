@@ -1,14 +1,32 @@
 from ursina import *
 from ursina.prefabs.first_person_controller import FirstPersonController
 from ursina.prefabs.button import Button
+from PIL import Image
 import random
-from enum import Enum
+from enum import IntEnum
+from contextlib import contextmanager
+from functools import partial
+from weakref import WeakSet
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import math
 
+_sin = math.sin # Bound once at import; the sine patrol calls it every frame
+logger = logging.getLogger(__name__) # Debug traces; %-style args are only formatted if emitted
+
+# Runtime constants, built once instead of at every use
+_PAUSE_CAM_OFFSET = Vec3(0, 5, -10) # Pause camera position relative to the player
+_WHITE = color.white
+_AMBIENT = color.rgba(100, 100, 100, 10) # Soft ambient light color
+
 # --- Constants and Configuration ---
 
-class GameState(Enum):
-    """Defines the various states the game can be in."""
+class GameState(IntEnum):
+    """
+    Defines the various states the game can be in. An IntEnum, so state checks
+    are plain int comparisons. The game-over states are kept last, so
+    `state >= GameState.WIN` means WIN or LOSE.
+    """
     MENU = 0
     PLAYING = 1
     PAUSED = 2
@@ -31,18 +49,28 @@ class GameConfig:
         self.PLAYER_HEIGHT_OFFSET = 0.5 # To place player correctly on ground
         self.PLAYER_MAX_HEALTH = 3
         self.PLAYER_HIT_INVULNERABILITY_TIME = 1.0 # seconds after taking damage
+        self.PLAYER_BLINK_INTERVAL = 0.1 # seconds between visibility toggles while invulnerable
+        self.PLAYER_HIT_RADIUS = 0.7 # Rough player radius for the projectile hit broad-phase
+        self.PLAYER_WALL_CLEARANCE = 0.3 # Closest the player's center gets to a maze wall
+
+        # Collision Settings
+        self.SPATIAL_HASH_CELL_SIZE = 2.0 # Bucket size of the broad-phase grid (world units)
 
         # Monster Settings
         self.MONSTER_SPEED = 2.5
         self.MONSTER_VISION_RANGE = 10 # How far the monster can "see" the player
+        self.MONSTER_VISION_RANGE_SQ = self.MONSTER_VISION_RANGE ** 2 # Squared, for sqrt-free range checks
         self.MONSTER_PATROL_TYPE = 'sine' # 'linear' or 'sine'
         self.MONSTER_PATROL_AMPLITUDE = 8 # Distance for monster to patrol if no player seen
         self.MONSTER_PATROL_FREQUENCY = 1.0 # How fast the sine wave oscillates
+        self.MONSTER_TURN_EPSILON = 0.01 # Chase direction change (|dx|+|dz|) below which the monster doesn't re-turn
         self.MONSTER_ATTACK_COOLDOWN = 3.0 # seconds between attacks
         self.MONSTER_ATTACK_WINDUP_TIME = 1.0 # time before projectile fires
         self.MONSTER_ATTACK_PROJECTILE_SPEED = 15
         self.MONSTER_ATTACK_PROJECTILE_LIFETIME = 2.0 # how long projectile exists
         self.MONSTER_ATTACK_DAMAGE = 1
+        self.MONSTER_PROJECTILE_POOL_SIZE = 8 # Projectiles pre-built at startup; the pool grows past this on demand
+        self.PROJECTILE_SPAWN_OFFSET = 0.1 # Gap between monster's front face and a new projectile
 
         # Maze Settings
         self.MAZE_DIMENSION = 20 # Maze will be MAZE_DIMENSION x MAZE_DIMENSION (must be odd for recursive backtracking)
@@ -62,6 +90,7 @@ class GameConfig:
         self.COLOR_PROJECTILE = color.magenta
         self.COLOR_GROUND_PATH = color.light_gray # Color for maze paths
         self.COLOR_GROUND_WALL = color.dark_gray # Color for maze walls
+        self.COLOR_GROUND_WALL_SIDE = color.dark_gray.tint(-.15) # Slightly darker vertical wall faces
         self.COLOR_OUTSIDE_MAZE = color.green # Color for area outside the maze
 
         # UI Colors
@@ -90,7 +119,7 @@ class Player(FirstPersonController):
     Custom player entity. Extends FirstPersonController for built-in FPS movement,
     with added game-specific logic for health, damage, and state management.
     """
-    def __init__(self, position):
+    def __init__(self, position, parent=scene):
         super().__init__(
             position=position,
             speed=game_config.PLAYER_SPEED,
@@ -98,7 +127,8 @@ class Player(FirstPersonController):
             gravity=game_config.GRAVITY,
             collider='box', # Collider against the terrain
             origin_y=-game_config.PLAYER_HEIGHT_OFFSET, # Adjust visual origin
-            name='player_entity'
+            name='player_entity',
+            parent=parent
         )
         self.start_position = position # Store initial position for restarts
         self.color = game_config.COLOR_PLAYER
@@ -106,7 +136,10 @@ class Player(FirstPersonController):
         self.max_health = game_config.PLAYER_MAX_HEALTH
         self.current_health = self.max_health
         self.is_invulnerable = False
-        self._invulnerability_timer = 0.0
+        self._blink_sequences = [] # Pending invoke() sequences for the hit blink
+        # FirstPersonController aliases on_destroy to on_disable; extend it so pending
+        # blink sequences don't outlive the entity
+        self.on_destroy = self._on_destroy
 
     def on_enable(self):
         """Called when the entity is enabled."""
@@ -124,39 +157,89 @@ class Player(FirstPersonController):
         mouse.locked = False # Unlock mouse when player is not active
         self.visible = False # Hide player when disabled
 
+    def _on_destroy(self):
+        """Called by destroy(): cancels the hit blink, then tears down like on_disable."""
+        self._cancel_invulnerability_blink()
+        self.on_disable()
+
     def update(self):
         """Player-specific update logic."""
+        prev_x, prev_y, prev_z = self.x, self.y, self.z
         super().update() # Call base FirstPersonController update
+        self._resolve_maze_collision(prev_x, prev_y, prev_z)
 
-        if self.is_invulnerable:
-            self._invulnerability_timer -= time.dt
-            # Simple blinking effect
-            self.visible = not self.visible if int(self._invulnerability_timer * 10) % 2 == 0 else True
-            if self._invulnerability_timer <= 0:
-                self.is_invulnerable = False
-                self.visible = True # Ensure visible after invulnerability ends
+    def _resolve_maze_collision(self, prev_x, prev_y, prev_z):
+        """
+        Analytic player-vs-wall collision against the maze grid (the maze mesh has
+        no collider). Each axis is blocked separately so the player slides along
+        walls; above wall height the player moves freely and lands on wall tops.
+        """
+        maze = game.maze_generator
+        wall_top = game_config.MAZE_WALL_HEIGHT
+
+        if prev_y >= wall_top:
+            # On or above the walls: don't sink into a wall cell when falling
+            if self.y < wall_top and maze.is_wall_at(self.x, self.z):
+                self.y = wall_top
+                self.land()
+            return
+
+        clearance = game_config.PLAYER_WALL_CLEARANCE
+        dx = self.x - prev_x
+        if dx and maze.is_wall_at(self.x + math.copysign(clearance, dx), prev_z):
+            self.x = prev_x
+        dz = self.z - prev_z
+        if dz and maze.is_wall_at(self.x, self.z + math.copysign(clearance, dz)):
+            self.z = prev_z
 
     def take_damage(self, amount):
         """Applies damage to the player."""
         if not self.is_invulnerable:
             self.current_health -= amount
-            print(f"Player took {amount} damage. Health: {self.current_health}/{self.max_health}")
+            logger.debug("Player took %s damage. Health: %s/%s", amount, self.current_health, self.max_health)
             game.ui_manager.update_health_display(self.current_health)
 
             if self.current_health <= 0:
                 game.set_game_state(GameState.LOSE)
             else:
                 self.is_invulnerable = True
-                self._invulnerability_timer = game_config.PLAYER_HIT_INVULNERABILITY_TIME
+                self._schedule_invulnerability_blink()
                 # Optional: Play a hit sound or animation here
 
+    def _schedule_invulnerability_blink(self):
+        """
+        Schedules the hit blink and the end of invulnerability as invoke() sequences,
+        so update() does no per-frame work while the player is invulnerable.
+        """
+        self._cancel_invulnerability_blink()
+        interval = game_config.PLAYER_BLINK_INTERVAL
+        duration = game_config.PLAYER_HIT_INVULNERABILITY_TIME
+        self.visible = False
+        self._blink_sequences = [
+            invoke(setattr, self, 'visible', i % 2 == 1, delay=i * interval)
+            for i in range(1, int(duration / interval))
+        ]
+        self._blink_sequences.append(invoke(self._end_invulnerability, delay=duration))
+
+    def _cancel_invulnerability_blink(self):
+        """Kills any pending blink sequences."""
+        for sequence in self._blink_sequences:
+            sequence.kill()
+        self._blink_sequences = []
+
+    def _end_invulnerability(self):
+        """Ends the post-hit invulnerability window."""
+        self._blink_sequences = []
+        self.is_invulnerable = False
+        self.visible = True # Ensure visible after invulnerability ends
+
     def reset_state(self):
         """Resets the player to their starting position, full health, and normal state."""
         self.position = self.start_position
         self.rotation = (0, 0, 0) # Reset player orientation
         self.current_health = self.max_health
+        self._cancel_invulnerability_blink()
         self.is_invulnerable = False
-        self._invulnerability_timer = 0.0
         self.visible = True
         self.enabled = True # Ensure enabled for next game, handled by GameState
         game.ui_manager.update_health_display(self.current_health) # Update UI
@@ -164,17 +247,20 @@ class Player(FirstPersonController):
 
 class Goal(Entity):
     """The goal entity the player needs to reach to win."""
-    def __init__(self, position):
+    def __init__(self, position, parent=scene):
         super().__init__(
             model='cube',
             color=game_config.COLOR_GOAL,
             scale=(game_config.CELL_SIZE * 0.8, game_config.MAZE_WALL_HEIGHT * 1.5, game_config.CELL_SIZE * 0.8),
             position=position,
             collider='box', # Trigger collider
-            name='goal_entity'
+            name='goal_entity',
+            parent=parent
         )
+        self.start_position = position # Store initial position for restarts
         # Goal should be placed slightly above the path height
-        self.y += game_config.MAZE_PATH_HEIGHT + self.scale_y / 2
+        self._hover_y = game_config.MAZE_PATH_HEIGHT + self.scale_y * 0.5
+        self.y += self._hover_y
         self.visible = True # Ensure visible initially
 
     def on_trigger_enter(self, other):
@@ -186,59 +272,152 @@ class Goal(Entity):
             invoke(game.set_game_state, GameState.WIN, delay=0.1)
 
     def reset_state(self):
-        """Resets the goal's state (mainly visibility)."""
+        """Moves the goal back to its starting position, hovering as when built, and shows it."""
+        self.position = self.start_position
+        self.y += self._hover_y
         self.enabled = True
         self.visible = True
 
 
 class MonsterProjectile(Entity):
-    """Represents a projectile fired by the monster."""
-    def __init__(self, start_pos, target_dir):
+    """
+    Represents a projectile fired by the monster.
+    Projectiles are built once by ProjectilePool and re-launched with spawn().
+    """
+    def __init__(self):
         super().__init__(
             model='sphere', # Or 'cube', depending on preference
             color=game_config.COLOR_PROJECTILE,
             scale=0.5,
-            position=start_pos,
             collider='sphere', # Smaller collider for projectile
-            name='monster_projectile'
+            name='monster_projectile',
+            enabled=False # Inactive until spawned
         )
         self.speed = game_config.MONSTER_ATTACK_PROJECTILE_SPEED
-        self.direction = target_dir.normalized()
+        self.direction = Vec3(0, 0, 0)
+        self._velocity = Vec3(0, 0, 0) # Constant for the duration of each shot
         self.lifetime = game_config.MONSTER_ATTACK_PROJECTILE_LIFETIME
+        self._timer = 0.0
+        self._needs_release = False # Set on expiry/hit, picked up by ProjectilePool.sweep
+        self._hover_y = game_config.MAZE_PATH_HEIGHT + self.scale_y * 0.5 # Keep it floating above ground
+        # Squared sum of projectile and player radii; only closer pairs get a real collider query
+        self._hit_radius_sq = (self.scale_y * 0.5 + game_config.PLAYER_HIT_RADIUS) ** 2
+
+    def spawn(self, start_pos, target_dir):
+        """Re-initializes the projectile in place for a new shot and activates it."""
+        self.position = start_pos
+        self.y = self._hover_y
+        self.direction = target_dir.normalized()
+        self._velocity = self.direction * self.speed
         self._timer = self.lifetime
-        self.y = game_config.MAZE_PATH_HEIGHT + self.scale_y / 2 # Keep it floating above ground
+        self._needs_release = False
+        self.enabled = True
+
+    def _retire(self):
+        """
+        Hides the projectile and flags it for release. The pool itself is only
+        touched by the once-per-frame sweep in Game.update, never mid-dispatch.
+        """
+        self.enabled = False
+        self._needs_release = True
 
     def update(self):
-        """Projectile movement and collision detection."""
-        self.position += self.direction * self.speed * time.dt
-        self._timer -= time.dt
+        """Projectile movement and lifetime. Player hits are resolved by Game.update."""
+        if game.current_state != GameState.PLAYING:
+            return # Don't move or age while the game isn't running
+
+        dt = time.dt
+        self.position += self._velocity * dt
+        self._timer -= dt
 
         if self._timer <= 0:
-            destroy(self) # Destroy projectile after its lifetime
+            self._retire() # Returned to the pool by the next sweep
 
-        # Check collision with player
-        if game.player and game.player.enabled and self.intersects(game.player).hit:
-            game.player.take_damage(game_config.MONSTER_ATTACK_DAMAGE)
-            destroy(self) # Destroy on hit
+    def try_hit(self, player):
+        """
+        Narrow-phase check against the player, for projectiles the spatial hash
+        reported as nearby. Damages the player and retires the projectile on hit.
+        """
+        # Cheap squared distance first, collider intersection only when close
+        dx = self.x - player.x
+        dy = self.y - player.y
+        dz = self.z - player.z
+        if dx * dx + dy * dy + dz * dz < self._hit_radius_sq and self.intersects(player).hit:
+            self._retire()
+            player.take_damage(game_config.MONSTER_ATTACK_DAMAGE)
+
+
+class ProjectilePool:
+    """
+    Pool of pre-built MonsterProjectile entities. Firing re-spawns an idle
+    projectile in place instead of constructing a new Entity, and expired
+    projectiles are disabled and returned instead of destroyed. If every
+    projectile is in flight, a new one is built and kept in the pool afterwards.
+    """
+    def __init__(self, size):
+        self._free = [MonsterProjectile() for _ in range(size)]
+        self.active = set() # Projectiles currently in flight
+
+    def acquire(self):
+        """Returns an idle projectile, building a new one only if none are idle."""
+        projectile = self._free.pop() if self._free else MonsterProjectile()
+        self.active.add(projectile)
+        return projectile
+
+    def release(self, projectile):
+        """Deactivates an in-flight projectile and makes it available again."""
+        if projectile not in self.active:
+            return # Already released
+        self.active.discard(projectile)
+        projectile.enabled = False
+        projectile._needs_release = False
+        self._free.append(projectile)
+
+    def release_all(self):
+        """Releases every in-flight projectile, straight from the tracked `active` set."""
+        for projectile in tuple(self.active):
+            self.release(projectile)
+
+    def sweep(self):
+        """Releases every in-flight projectile that retired since the last sweep."""
+        retired = [p for p in self.active if p._needs_release]
+        for projectile in retired:
+            self.release(projectile)
+
+    def set_frozen(self, frozen):
+        """
+        Disables (freezes) or re-enables all in-flight projectiles without
+        releasing them, so a paused shot resumes where it was.
+        """
+        for projectile in self.active:
+            projectile.enabled = not frozen and not projectile._needs_release
 
 
 class Monster(Entity):
     """The monster entity that patrols, chases, and attacks the player."""
-    def __init__(self, position):
+    def __init__(self, position, parent=scene):
         super().__init__(
             model='cube',
             color=game_config.COLOR_MONSTER,
             scale=(game_config.CELL_SIZE * 1.2, game_config.MAZE_WALL_HEIGHT * 1.5, game_config.CELL_SIZE * 1.2),
             position=position,
             collider='box',
-            name='monster_entity'
+            name='monster_entity',
+            parent=parent
         )
         self.start_position = position
         self.speed = game_config.MONSTER_SPEED
+        self._speed_dt = 0.0 # speed * time.dt, refreshed at the top of update()
         self.current_patrol_time = 0.0 # For sine wave patrolling
         self.patrol_start_x = position.x # Base for sine wave
+        # Facing caches, so look_at only runs when the heading actually changes
+        self._last_dir_sign = 0 # Sine patrol heading along x (+1/-1), 0 = unknown
+        self._last_chase_dir = None # Chase heading the monster last turned to
 
-        self.y = game_config.MAZE_PATH_HEIGHT + self.scale_y / 2 # Keep it floating above ground
+        self._hover_y = game_config.MAZE_PATH_HEIGHT + self.scale_y * 0.5
+        self.y = self._hover_y # Keep it floating above ground
+        # Distance from center to where projectiles spawn, just in front of the monster
+        self._projectile_spawn_distance = self.scale_x * 0.5 + game_config.PROJECTILE_SPAWN_OFFSET
 
         self._attack_cooldown_timer = 0.0
         self._attack_windup_timer = 0.0
@@ -252,29 +431,41 @@ class Monster(Entity):
         if game.current_state != GameState.PLAYING:
             return
 
+        # Bind per-frame lookups to locals once
+        cfg = game_config
+        dt = time.dt
+        player = game.player
+        player_active = player is not None and player.enabled
+        self._speed_dt = self.speed * dt # Scalar step length shared by chase/patrol this frame
+
         if self._is_winding_up_attack:
-            self._attack_windup_timer -= time.dt
+            self._attack_windup_timer -= dt
             if self._attack_windup_timer <= 0:
                 self._execute_attack()
                 self._is_winding_up_attack = False
-                self._attack_cooldown_timer = game_config.MONSTER_ATTACK_COOLDOWN
-                self.color = game_config.COLOR_MONSTER # Reset color
+                self._attack_cooldown_timer = cfg.MONSTER_ATTACK_COOLDOWN
+                self.color = cfg.COLOR_MONSTER # Reset color
             else:
                 # Keep facing player during wind-up
-                if game.player and game.player.enabled:
-                    self.look_at(game.player.position)
+                if player_active:
+                    self._turn_to(player.position)
             return # Don't move or start new attack while winding up
 
-        self._attack_cooldown_timer -= time.dt
+        self._attack_cooldown_timer -= dt
 
-        # Check if player is within vision range
-        player_in_range = game.player and game.player.enabled and \
-                          distance(self.position, game.player.position) < game_config.MONSTER_VISION_RANGE
+        # Check if player is within vision range (squared distance on the XZ plane, no sqrt)
+        player_in_range = False
+        if player_active:
+            pos = self.position
+            ppos = player.position
+            dx = pos.x - ppos.x
+            dz = pos.z - ppos.z
+            player_in_range = dx * dx + dz * dz < cfg.MONSTER_VISION_RANGE_SQ
 
         if player_in_range and self._attack_cooldown_timer <= 0:
             # Player in range and attack off cooldown - initiate attack wind-up
             self._start_attack_windup()
-            self.color = game_config.COLOR_MONSTER_ATTACK_CUE # Visual cue
+            self.color = cfg.COLOR_MONSTER_ATTACK_CUE # Visual cue
         elif player_in_range:
             # Player in range but attack on cooldown, just chase
             self._chase_player()
@@ -286,8 +477,19 @@ class Monster(Entity):
         """Monster chases the player."""
         direction_to_target = (game.player.position - self.position).normalized()
         direction_to_target.y = 0 # Keep movement on XZ plane
-        self.position += direction_to_target * self.speed * time.dt
-        self.look_at(self.position + direction_to_target)
+        self.position += direction_to_target * self._speed_dt
+
+        last = self._last_chase_dir
+        if (last is None or abs(direction_to_target.x - last.x) + abs(direction_to_target.z - last.z)
+                > game_config.MONSTER_TURN_EPSILON):
+            self._turn_to(self.position + direction_to_target)
+            self._last_chase_dir = direction_to_target
+
+    def _turn_to(self, target):
+        """look_at that also drops the cached chase/sine-patrol headings."""
+        self.look_at(target)
+        self._last_dir_sign = 0
+        self._last_chase_dir = None
 
     def _patrol(self):
         """Monster patrols based on configured type."""
@@ -303,20 +505,22 @@ class Monster(Entity):
 
             if self.target_position:
                 direction_to_target = (self.target_position - self.position).normalized()
-                self.position += direction_to_target * self.speed * time.dt
-                self.look_at(self.position + direction_to_target)
+                self.position += direction_to_target * self._speed_dt
+                self._turn_to(self.position + direction_to_target)
 
         elif game_config.MONSTER_PATROL_TYPE == 'sine':
-            self.current_patrol_time += time.dt * game_config.MONSTER_PATROL_FREQUENCY
-            new_x = self.patrol_start_x + math.sin(self.current_patrol_time) * game_config.MONSTER_PATROL_AMPLITUDE
+            cfg = game_config
+            self.current_patrol_time += time.dt * cfg.MONSTER_PATROL_FREQUENCY
+            new_x = self.patrol_start_x + _sin(self.current_patrol_time) * cfg.MONSTER_PATROL_AMPLITUDE
 
             old_x = self.position.x
             self.position = Vec3(new_x, self.y, self.start_position.z)
 
-            if new_x > old_x:
-                self.look_at(self.position + Vec3(1,0,0))
-            else:
-                self.look_at(self.position + Vec3(-1,0,0))
+            # Only turn when the patrol reverses, at the sine's extremes
+            sign = 1 if new_x > old_x else -1
+            if sign != self._last_dir_sign:
+                self._turn_to(self.position + Vec3(sign,0,0))
+                self._last_dir_sign = sign
 
     def _start_attack_windup(self):
         """Initiates the monster's attack wind-up phase."""
@@ -337,8 +541,8 @@ class Monster(Entity):
             # Determine projectile direction (from monster to target)
             direction_to_target = (self.target_for_attack - self.position).normalized()
             # Spawn projectile slightly in front of the monster
-            projectile_spawn_pos = self.position + self.forward * (self.scale_x / 2 + 0.1)
-            MonsterProjectile(projectile_spawn_pos, direction_to_target)
+            projectile_spawn_pos = self.position + self.forward * self._projectile_spawn_distance
+            game.acquire_projectile(projectile_spawn_pos, direction_to_target)
             # Optional: Play attack sound
             # Audio('monster_shoot.wav', autoplay=True)
         self.target_for_attack = None # Clear target for next attack
@@ -346,9 +550,11 @@ class Monster(Entity):
     def reset_state(self):
         """Resets the monster to its starting position and state."""
         self.position = self.start_position
-        self.y = game_config.MAZE_PATH_HEIGHT + self.scale_y / 2
+        self.y = self._hover_y
         self.target_position = None # Clear patrol target
         self.current_patrol_time = 0.0 # Reset sine wave patrol
+        self._last_dir_sign = 0
+        self._last_chase_dir = None
         self._attack_cooldown_timer = 0.0
         self._attack_windup_timer = 0.0
         self._is_winding_up_attack = False
@@ -359,161 +565,228 @@ class Monster(Entity):
 
 # --- Maze and Terrain Generation ---
 
+def _carve_maze(grid, dim, start_x, start_y):
+    """
+    Recursive-backtracker kernel. Carves paths (0) into a flat, wall-filled (1)
+    grid of dim x dim cells, starting from (start_x, start_y).
+
+    Works purely on integer cell indices with an explicit stack: no Python
+    recursion, no tuples, and no x/z bounds tests in the hot loop.
+    """
+    size = dim * dim
+    cells = memoryview(grid) # Skip bytearray item dispatch in the hot loop
+
+    # Mark the border as uncarvable (2). A step off either side of a row wraps
+    # onto a border column, so the only bounds test left is on the flat index.
+    for i in range(dim):
+        cells[i] = cells[size - dim + i] = cells[i * dim] = cells[i * dim + dim - 1] = 2
+
+    steps = [1, -1, dim, -dim] # +X, -X, +Z, -Z as flat index offsets
+    shuffle = random.shuffle
+
+    current = start_y * dim + start_x
+    cells[current] = 0 # Mark start cell as path
+    stack = [current]
+    while stack:
+        current = stack[-1]
+
+        # Randomly shuffle directions and take the first unvisited cell 2 steps away
+        shuffle(steps)
+        for step in steps:
+            target = current + 2 * step
+            if 0 <= target < size and cells[target] == 1:
+                cells[current + step] = 0 # Carve path between current and next cell
+                cells[target] = 0
+                stack.append(target)
+                break
+        else:
+            stack.pop() # Dead end, backtrack
+
+    # Restore the border to plain walls
+    for i in range(dim):
+        cells[i] = cells[size - dim + i] = cells[i * dim] = cells[i * dim + dim - 1] = 1
+    cells.release()
+
+
 class TerrainMazeGenerator:
     """
     Generates a maze integrated into the ground, dynamically creating a Mesh.
     Uses recursive backtracking for maze generation.
     """
-    def __init__(self, dimension, cell_size, wall_height, path_height):
+    # Grid-space direction (dx, dz) each vertical wall face points towards
+    FACE_NORMALS = {
+        'north': (0, 1),
+        'south': (0, -1),
+        'east': (1, 0),
+        'west': (-1, 0),
+    }
+
+    # Texel centers in the 2x2 ground atlas: top row holds cell tops, bottom row wall sides
+    ATLAS_UV_WALL_TOP = (0.25, 0.75)
+    ATLAS_UV_PATH_TOP = (0.75, 0.75)
+    ATLAS_UV_WALL_SIDE = (0.25, 0.25)
+
+    def __init__(self, dimension, cell_size, wall_height, path_height, parent=scene):
+        self.parent = parent # Scene node the maze mesh entity is attached to
         self.dimension = dimension
         self.cell_size = cell_size
         self.wall_height = wall_height
         self.path_height = path_height
-        self.maze_grid = [] # Stores the generated maze layout (0=path, 1=wall)
+        self.maze_grid = bytearray() # Flat maze layout, cell (x, z) at z*dimension + x (0=path, 1=wall)
+        self._mv = memoryview(self.maze_grid) # Read view of maze_grid, see at()
+        self._path_cells = None # Cached interior path cells of the current maze, see _interior_path_cells
         self.mesh_entity = None # The Ursina entity holding the mesh
+        self._cached_mesh_entity = None # Last built mesh entity, kept (hidden) for reuse
+        self._cached_grid = None # bytes of the maze_grid _cached_mesh_entity was built from
+        self.atlas_texture = self._create_atlas_texture() # Ground colors, sampled via UVs
 
-    def generate_random_maze(self):
+    def _create_atlas_texture(self):
         """
-        Generates a random maze using recursive backtracking and
-        creates an Ursina Mesh for the terrain based on it.
+        Bakes the ground colors into a tiny 2x2 texture so the mesh can select a
+        color per quad through its UVs instead of storing a color per vertex.
+        """
+        def to_rgba(c):
+            return tuple(int(round(channel * 255)) for channel in c)
+
+        image = Image.new('RGBA', (2, 2))
+        # Image row 0 ends up at the top of the texture (v = 0.75 in UV space)
+        image.putpixel((0, 0), to_rgba(game_config.COLOR_GROUND_WALL))
+        image.putpixel((1, 0), to_rgba(game_config.COLOR_GROUND_PATH))
+        image.putpixel((0, 1), to_rgba(game_config.COLOR_GROUND_WALL_SIDE))
+        image.putpixel((1, 1), to_rgba(game_config.COLOR_GROUND_WALL_SIDE)) # Unused, padding
+        return Texture(image, filtering=None) # No filtering, so texels don't bleed into each other
+
+    def generate_maze_grid(self):
+        """
+        Carves and returns a new flat maze grid without installing it. Reads no
+        generator state and touches no Ursina objects, so it may run on a worker
+        thread (see Game.start_game); the result is installed with set_maze_grid.
         """
-        self.clear_maze() # Clear any existing mesh/entities
-
         # Initialize grid with all walls (1) and borders
-        self.maze_grid = [[1 for _ in range(self.dimension)] for _ in range(self.dimension)]
+        grid = bytearray(b'\x01' * (self.dimension * self.dimension))
 
         # Start carving path from a random point (must be odd coordinates for algorithm)
         start_x, start_y = (random.randrange(self.dimension // 2) * 2 + 1,
                             random.randrange(self.dimension // 2) * 2 + 1)
-        self._carve_path(start_x, start_y)
-
-        # Create the mesh for the ground terrain
-        self._create_mesh_from_grid()
-
-    def _carve_path(self, cx, cy):
-        """
-        Recursive function to carve paths in the maze grid.
-        cx, cy are current coordinates.
-        """
-        self.maze_grid[cy][cx] = 0 # Mark current cell as path
+        _carve_maze(grid, self.dimension, start_x, start_y)
+        return grid
 
-        # Randomly shuffle directions (dx, dy)
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        random.shuffle(directions)
+    def set_maze_grid(self, grid):
+        """Installs a grid from generate_maze_grid as the current maze. Main thread only."""
+        self.maze_grid = grid
+        self._mv = memoryview(grid)
+        self._path_cells = None
 
-        for dx, dy in directions:
-            nx, ny = cx + dx * 2, cy + dy * 2 # Next cell (2 steps away)
-            if 0 < nx < self.dimension - 1 and 0 < ny < self.dimension - 1 and self.maze_grid[ny][nx] == 1:
-                # If next cell is within bounds and is a wall, carve path to it
-                self.maze_grid[cy + dy][cx + dx] = 0 # Carve path between current and next cell
-                self._carve_path(nx, ny) # Recurse
+    def build_maze_mesh(self):
+        """Creates the terrain mesh entity for the current maze_grid. Main thread only."""
+        self._create_mesh_from_grid()
 
     def _create_mesh_from_grid(self):
         """
         Generates a custom mesh for the ground based on the maze grid.
         Walls are raised, paths are flat.
-        """
-        vertices = []
-        triangles = []
-        colors = []
-        uvs = [] # Not using textures, but good practice to include
 
-        # Iterate over each cell in the maze grid
-        for z_idx in range(self.dimension):
-            for x_idx in range(self.dimension):
-                is_wall = (self.maze_grid[z_idx][x_idx] == 1)
+        Uses greedy meshing: contiguous runs of identical cells are merged into
+        a single rectangle, so a long straight wall or corridor becomes one quad
+        instead of one quad per cell.
+
+        If the grid is identical to the one the last mesh was built from, that
+        mesh entity is re-enabled instead of rebuilding and re-uploading it.
+        """
+        grid_key = bytes(self.maze_grid)
+        if self._cached_mesh_entity is not None:
+            if grid_key == self._cached_grid:
+                self.mesh_entity = self._cached_mesh_entity
+                self.mesh_entity.enabled = True
+                return
+            destroy(self._cached_mesh_entity)
+            self._cached_mesh_entity = None
+
+        # World coordinate of every grid line, computed once instead of per quad.
+        # Grid line i sits at (i - dimension/2) * cell_size (maze centered around (0,0)).
+        grid_lines = [(i - self.dimension / 2) * self.cell_size for i in range(self.dimension + 1)]
+
+        dim = self.dimension
+        grid = self._mv
+        runs = [] # (x0, x1, z0, z1, height, texel, face_dir) per quad, see _emit_run
+
+        # Top faces: classic 2D greedy sweep over cells of the same type (wall/path)
+        visited = bytearray(dim * dim)
+        for z_idx in range(dim):
+            row = z_idx * dim
+            for x_idx in range(dim):
+                if visited[row + x_idx]:
+                    continue
+                cell = grid[row + x_idx]
+
+                # Grow the run along +X as far as the cells match
+                x_end = x_idx + 1
+                while x_end < dim and not visited[row + x_end] and grid[row + x_end] == cell:
+                    x_end += 1
+
+                # Then grow the whole run along +Z while the next row matches it
+                z_end = z_idx + 1
+                while z_end < dim and all(not visited[z_end * dim + x] and grid[z_end * dim + x] == cell
+                                          for x in range(x_idx, x_end)):
+                    z_end += 1
+
+                for z in range(z_idx, z_end):
+                    visited[z * dim + x_idx:z * dim + x_end] = b'\x01' * (x_end - x_idx)
+
+                is_wall = (cell == 1)
                 height = self.wall_height if is_wall else self.path_height
-                cell_color = game_config.COLOR_GROUND_WALL if is_wall else game_config.COLOR_GROUND_PATH
-
-                # Calculate base position for the current cell
-                # We offset by half the dimension to center the maze around (0,0)
-                base_x = (x_idx - self.dimension / 2) * self.cell_size
-                base_z = (z_idx - self.dimension / 2) * self.cell_size
-
-                # Define vertices for the top face of the cell
-                # Ensure order is consistent for normals
-                v_bl = Vec3(base_x, height, base_z)
-                v_br = Vec3(base_x + self.cell_size, height, base_z)
-                v_tr = Vec3(base_x + self.cell_size, height, base_z + self.cell_size)
-                v_tl = Vec3(base_x, height, base_z + self.cell_size)
-
-                current_vert_start_idx = len(vertices)
-                vertices.extend([v_bl, v_br, v_tr, v_tl])
-                colors.extend([cell_color] * 4)
-                uvs.extend([(0,0), (1,0), (1,1), (0,1)])
-
-                # Triangles for top face (clockwise for front-facing normal)
-                triangles.extend([current_vert_start_idx + 0, current_vert_start_idx + 1, current_vert_start_idx + 2, # BL, BR, TR
-                                  current_vert_start_idx + 0, current_vert_start_idx + 2, current_vert_start_idx + 3]) # BL, TR, TL
-
-                # Add side faces if this cell is a wall and adjacent to a path or edge of maze
-                # These faces go from `height` down to `path_height`
-
-                # North Face (towards positive Z)
-                # Check if it's the top edge of the maze or if the cell above is a path
-                if z_idx == self.dimension - 1 or (z_idx + 1 < self.dimension and self.maze_grid[z_idx+1][x_idx] == 0):
-                    if is_wall: # Only draw wall sides if current cell is a wall
-                        v_n_bl = Vec3(base_x, self.path_height, base_z + self.cell_size)
-                        v_n_br = Vec3(base_x + self.cell_size, self.path_height, base_z + self.cell_size)
-                        v_n_tr = v_tr
-                        v_n_tl = v_tl
-                        current_vert_start_idx = len(vertices)
-                        vertices.extend([v_n_bl, v_n_br, v_n_tr, v_n_tl])
-                        colors.extend([cell_color] * 4)
-                        uvs.extend([(0,0), (1,0), (1,1), (0,1)])
-                        triangles.extend([current_vert_start_idx + 0, current_vert_start_idx + 1, current_vert_start_idx + 2,
-                                          current_vert_start_idx + 0, current_vert_start_idx + 2, current_vert_start_idx + 3])
-
-                # South Face (towards negative Z)
-                # Check if it's the bottom edge of the maze or if the cell below is a path
-                if z_idx == 0 or (z_idx - 1 >= 0 and self.maze_grid[z_idx-1][x_idx] == 0):
-                    if is_wall:
-                        v_s_bl = Vec3(base_x, self.path_height, base_z)
-                        v_s_br = Vec3(base_x + self.cell_size, self.path_height, base_z)
-                        v_s_tr = v_br
-                        v_s_tl = v_bl
-                        current_vert_start_idx = len(vertices)
-                        vertices.extend([v_s_br, v_s_bl, v_s_tl, v_s_tr]) # Order for correct normal
-                        colors.extend([cell_color] * 4)
-                        uvs.extend([(0,0), (1,0), (1,1), (0,1)])
-                        triangles.extend([current_vert_start_idx + 0, current_vert_start_idx + 1, current_vert_start_idx + 2,
-                                          current_vert_start_idx + 0, current_vert_start_idx + 2, current_vert_start_idx + 3])
-
-                # East Face (towards positive X)
-                # Check if it's the right edge of the maze or if the cell to the right is a path
-                if x_idx == self.dimension - 1 or (x_idx + 1 < self.dimension and self.maze_grid[z_idx][x_idx+1] == 0):
-                    if is_wall:
-                        v_e_bl = Vec3(base_x + self.cell_size, self.path_height, base_z)
-                        v_e_br = Vec3(base_x + self.cell_size, self.path_height, base_z + self.cell_size)
-                        v_e_tr = v_tr
-                        v_e_tl = v_br
-                        current_vert_start_idx = len(vertices)
-                        vertices.extend([v_e_bl, v_e_br, v_e_tr, v_e_tl])
-                        colors.extend([cell_color] * 4)
-                        uvs.extend([(0,0), (1,0), (1,1), (0,1)])
-                        triangles.extend([current_vert_start_idx + 0, current_vert_start_idx + 1, current_vert_start_idx + 2,
-                                          current_vert_start_idx + 0, current_vert_start_idx + 2, current_vert_start_idx + 3])
-
-                # West Face (towards negative X)
-                # Check if it's the left edge of the maze or if the cell to the left is a path
-                if x_idx == 0 or (x_idx - 1 >= 0 and self.maze_grid[z_idx][x_idx-1] == 0):
-                    if is_wall:
-                        v_w_bl = Vec3(base_x, self.path_height, base_z)
-                        v_w_br = Vec3(base_x, self.path_height, base_z + self.cell_size)
-                        v_w_tr = v_tl
-                        v_w_tl = v_bl
-                        current_vert_start_idx = len(vertices)
-                        vertices.extend([v_w_br, v_w_bl, v_w_tl, v_w_tr]) # Order for correct normal
-                        colors.extend([cell_color] * 4)
-                        uvs.extend([(0,0), (1,0), (1,1), (0,1)])
-                        triangles.extend([current_vert_start_idx + 0, current_vert_start_idx + 1, current_vert_start_idx + 2,
-                                          current_vert_start_idx + 0, current_vert_start_idx + 2, current_vert_start_idx + 3])
+                texel = self.ATLAS_UV_WALL_TOP if is_wall else self.ATLAS_UV_PATH_TOP
+                runs.append((x_idx, x_end, z_idx, z_end, height, texel, 'top'))
+
+        # Side faces: only wall cells next to a path (or the maze edge) get a side.
+        # These faces go from `wall_height` down to `path_height`, and runs are
+        # merged along the face's own plane (X for north/south, Z for east/west).
+        side_masks = self._exposed_side_masks()
+        for face_dir, (dx, dz) in self.FACE_NORMALS.items():
+            mask = side_masks[face_dir]
+            if dz != 0: # North/South faces lie in a Z plane, merge along X
+                for z_idx in range(dim):
+                    row = z_idx * dim
+                    x_idx = 0
+                    while x_idx < dim:
+                        if not mask[row + x_idx]:
+                            x_idx += 1
+                            continue
+                        x_end = x_idx + 1
+                        while x_end < dim and mask[row + x_end]:
+                            x_end += 1
+                        runs.append((x_idx, x_end, z_idx, z_idx + 1, self.wall_height,
+                                     self.ATLAS_UV_WALL_SIDE, face_dir))
+                        x_idx = x_end
+            else: # East/West faces lie in an X plane, merge along Z
+                for x_idx in range(dim):
+                    z_idx = 0
+                    while z_idx < dim:
+                        if not mask[z_idx * dim + x_idx]:
+                            z_idx += 1
+                            continue
+                        z_end = z_idx + 1
+                        while z_end < dim and mask[z_end * dim + x_idx]:
+                            z_end += 1
+                        runs.append((x_idx, x_idx + 1, z_idx, z_end, self.wall_height,
+                                     self.ATLAS_UV_WALL_SIDE, face_dir))
+                        z_idx = z_end
+
+        # Every run is exactly one quad, so the buffers are allocated once at their
+        # final size and filled by index instead of growing through extend().
+        quad_count = len(runs)
+        vertices = [None] * (quad_count * 4)
+        uvs = [None] * (quad_count * 4) # Atlas texel per vertex, replaces per-vertex colors
+        triangles = [0] * (quad_count * 6)
+        for quad_idx, run in enumerate(runs):
+            self._emit_run(vertices, uvs, triangles, grid_lines, quad_idx, *run)
 
         # Create the Ursina mesh entity
         self.mesh_entity = Entity(
-            model=Mesh(vertices=vertices, triangles=triangles, colors=colors, uvs=uvs, mode='triangle'),
-            collider='mesh', # Use a mesh collider for accurate collision
-            texture='white_cube', # A generic texture to see the shape
+            model=Mesh(vertices=vertices, triangles=triangles, uvs=uvs, mode='triangle'),
+            collider=None, # Walls are resolved analytically against maze_grid (see is_wall_at)
+            texture=self.atlas_texture, # Wall/path/side colors, selected by UV
+            parent=self.parent,
             position=(0,0,0), # Mesh is built with world positions already
             scale=1,
             name='maze_ground_mesh',
@@ -521,15 +794,90 @@ class TerrainMazeGenerator:
             # You might need a light entity in your scene for this to have effect
             # e.g., PointLight(position=(0,10,0), color=color.white)
         )
-        self.mesh_entity.set_shader_input('light_color', color.white) # Example for a basic shader
+        self.mesh_entity.set_shader_input('light_color', _WHITE) # Example for a basic shader
+        self._cached_mesh_entity = self.mesh_entity
+        self._cached_grid = grid_key
+
+    def _exposed_side_masks(self):
+        """
+        Returns a flat mask (same layout as maze_grid) per FACE_NORMALS direction,
+        marking wall cells whose neighbor in that direction is a path or lies
+        outside the maze, i.e. cells that need a side face.
+        All four masks are filled in a single pass over the grid.
+        """
+        dim = self.dimension
+        last = dim - 1
+        grid = self._mv
+        north, south, east, west = (bytearray(dim * dim) for _ in range(4))
+        for z_idx in range(dim):
+            row = z_idx * dim
+            for x_idx in range(dim):
+                i = row + x_idx
+                if grid[i] != 1:
+                    continue
+                # Edge of the maze counts as exposed; otherwise check the neighbor is a path
+                if z_idx == last or grid[i + dim] == 0:
+                    north[i] = 1
+                if z_idx == 0 or grid[i - dim] == 0:
+                    south[i] = 1
+                if x_idx == last or grid[i + 1] == 0:
+                    east[i] = 1
+                if x_idx == 0 or grid[i - 1] == 0:
+                    west[i] = 1
+        return {'north': north, 'south': south, 'east': east, 'west': west}
+
+    def _emit_run(self, vertices, uvs, triangles, grid_lines, quad_idx, x0, x1, z0, z1, height, texel, face_dir):
+        """
+        Writes quad number `quad_idx` (4 vertices, 6 indices) into the preallocated
+        `vertices`, `uvs` and `triangles` buffers, covering the grid rectangle
+        [x0, x1) x [z0, z1), colored by the atlas `texel` (u, v).
+        `grid_lines` holds the world coordinate of each grid line.
+        `face_dir` is 'top' or one of FACE_NORMALS' keys; side faces span from
+        `height` down to the path height.
+        """
+        # Grid indices to world coordinates via the precomputed grid lines
+        wx0, wx1, wz0, wz1 = grid_lines[x0], grid_lines[x1], grid_lines[z0], grid_lines[z1]
+        low = self.path_height
+
+        # Vertex order per face matches the winding used for correct normals.
+        # Plain tuples are enough for Mesh and avoid allocating a Vec3 per vertex.
+        if face_dir == 'top':
+            quad = ((wx0, height, wz0), (wx1, height, wz0), (wx1, height, wz1), (wx0, height, wz1))
+        elif face_dir == 'north':
+            quad = ((wx0, low, wz1), (wx1, low, wz1), (wx1, height, wz1), (wx0, height, wz1))
+        elif face_dir == 'south':
+            quad = ((wx1, low, wz0), (wx0, low, wz0), (wx0, height, wz0), (wx1, height, wz0))
+        elif face_dir == 'east':
+            quad = ((wx1, low, wz0), (wx1, low, wz1), (wx1, height, wz1), (wx1, height, wz0))
+        else: # 'west'
+            quad = ((wx0, low, wz1), (wx0, low, wz0), (wx0, height, wz0), (wx0, height, wz1))
+
+        # Same-length slice assignment fills in place, the lists never resize
+        v = quad_idx * 4
+        t = quad_idx * 6
+        vertices[v:v + 4] = quad
+        uvs[v:v + 4] = (texel, texel, texel, texel) # Whole quad samples one atlas texel
+        triangles[t:t + 6] = (v, v + 1, v + 2, v, v + 2, v + 3)
 
 
     def clear_maze(self):
-        """Destroys the existing maze mesh entity."""
+        """Hides the current maze mesh entity; it is kept for reuse by _create_mesh_from_grid."""
         if self.mesh_entity:
-            destroy(self.mesh_entity)
+            self.mesh_entity.enabled = False
             self.mesh_entity = None
-        self.maze_grid = [] # Clear grid data
+        self.maze_grid = bytearray() # Clear grid data
+        self._mv = memoryview(self.maze_grid)
+        self._path_cells = None
+
+    def at(self, x, z):
+        """Returns the cell value (0=path, 1=wall) at grid coordinates (x, z)."""
+        return self._mv[z * self.dimension + x]
+
+    @property
+    def grid_rows(self):
+        """The maze as a nested list of rows (maze_grid[z][x] style). For debug prints only."""
+        dim = self.dimension
+        return [list(self.maze_grid[z * dim:(z + 1) * dim]) for z in range(len(self.maze_grid) // dim)]
 
     def get_world_position(self, grid_x, grid_z):
         """Converts grid coordinates to world coordinates, considering cell size and centering."""
@@ -539,129 +887,348 @@ class TerrainMazeGenerator:
         # Y position is path height + player offset
         return Vec3(world_x, game_config.MAZE_PATH_HEIGHT + game_config.PLAYER_HEIGHT_OFFSET, world_z)
 
-    def _is_valid_grid_pos(self, x, y):
-        """Checks if grid coordinates are within maze bounds and are a path."""
-        return 0 <= x < self.dimension and \
-               0 <= y < self.dimension and \
-               self.maze_grid[y][x] == 0
+    def is_wall_at(self, world_x, world_z):
+        """
+        Returns True if a world XZ position lies on a wall cell. The grid itself is
+        the collision structure: one index computation instead of a mesh collider query.
+        Positions outside the maze are open ground.
+        """
+        dim = self.dimension
+        grid_x = math.floor(world_x / self.cell_size + dim / 2)
+        grid_z = math.floor(world_z / self.cell_size + dim / 2)
+        if not self.maze_grid or not (0 <= grid_x < dim and 0 <= grid_z < dim):
+            return False
+        return self.at(grid_x, grid_z) == 1
+
+    def _interior_path_cells(self):
+        """
+        Returns every path cell not on the maze border as (x, z), in row-major order.
+        Computed in one pass over the grid and cached until the maze changes.
+        """
+        if self._path_cells is None:
+            dim = self.dimension
+            grid = self._mv
+            self._path_cells = [(x_idx, z_idx)
+                                for z_idx in range(1, dim - 1)
+                                for x_idx in range(1, dim - 1)
+                                if grid[z_idx * dim + x_idx] == 0]
+        return self._path_cells
 
     def find_spawn_point(self):
         """Finds a valid spawn point (path) near the beginning of the maze."""
-        for z_idx in range(1, self.dimension - 1):
-            for x_idx in range(1, self.dimension - 1):
-                if self._is_valid_grid_pos(x_idx, z_idx):
-                    return (x_idx, z_idx)
+        path_cells = self._interior_path_cells()
+        if path_cells:
+            return path_cells[0]
         return (1, 1) # Fallback if no valid path found (shouldn't happen with proper generation)
 
     def find_goal_point(self):
         """Finds a valid goal point (path) near the end of the maze."""
-        for z_idx in range(self.dimension - 2, 0, -1):
-            for x_idx in range(self.dimension - 2, 0, -1):
-                if self._is_valid_grid_pos(x_idx, z_idx):
-                    return (x_idx, z_idx)
+        path_cells = self._interior_path_cells()
+        if path_cells:
+            return path_cells[-1]
         return (self.dimension - 2, self.dimension - 2) # Fallback
 
     def find_monster_spawn_point(self):
         """Finds a valid spawn point for the monster, typically not near player/goal."""
-        attempts = 0
-        while attempts < 100:
-            x = random.randint(1, self.dimension - 2)
-            y = random.randint(1, self.dimension - 2)
-            if self._is_valid_grid_pos(x, y):
-                # Basic check to prevent spawning monster too close to player/goal initially
-                player_pos_grid = self.find_spawn_point() # Assuming these are consistent
-                goal_pos_grid = self.find_goal_point()
-
-                dist_to_player = abs(x - player_pos_grid[0]) + abs(y - player_pos_grid[1])
-                dist_to_goal = abs(x - goal_pos_grid[0]) + abs(y - goal_pos_grid[1])
-
-                if dist_to_player > self.dimension / 4 and dist_to_goal > self.dimension / 4:
-                    return (x, y)
-            attempts += 1
+        player_x, player_z = self.find_spawn_point()
+        goal_x, goal_z = self.find_goal_point()
+        min_dist = self.dimension / 4
+
+        # Pick uniformly among path cells far enough (Manhattan) from player and goal
+        candidates = [(x, z) for x, z in self._interior_path_cells()
+                      if abs(x - player_x) + abs(z - player_z) > min_dist
+                      and abs(x - goal_x) + abs(z - goal_z) > min_dist]
+        if candidates:
+            return random.choice(candidates)
         return (self.dimension // 2, self.dimension // 2) # Fallback to center
 
 
+# --- Collision Broad-Phase ---
+
+class SpatialHash:
+    """
+    Uniform 2D spatial hash over the XZ plane, used as a collision broad-phase.
+    Entities are bucketed by the cell containing their position; a query returns
+    the entities in the 3x3 block of cells around a point, so only those need a
+    precise collision test.
+    """
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self._buckets = {} # Hash key -> list of entities in that cell
+        self._spare_buckets = [] # Emptied bucket lists, reused across frames to avoid churn
+        self._query_result = [] # Reused result list for query()
+        self._query_keys = set() # Reused set of bucket keys already visited by query()
+
+    @staticmethod
+    def _key(ix, iz):
+        """Hashes integer cell coordinates (prime-XOR hash; collisions only add candidates)."""
+        return (73856093 * ix) ^ (83492791 * iz)
+
+    def clear(self):
+        """Empties all buckets, keeping the lists for the next rebuild."""
+        spare = self._spare_buckets
+        for bucket in self._buckets.values():
+            bucket.clear()
+            spare.append(bucket)
+        self._buckets.clear()
+
+    def insert(self, entity):
+        """Adds an entity to the bucket of the cell containing its position."""
+        key = self._key(int(entity.x // self.cell_size), int(entity.z // self.cell_size))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._spare_buckets.pop() if self._spare_buckets else []
+            self._buckets[key] = bucket
+        bucket.append(entity)
+
+    def query(self, position):
+        """
+        Returns the entities in the 3x3 cell neighborhood of a position.
+        The returned list is reused by the next query; copy it to keep it.
+        """
+        result = self._query_result
+        result.clear()
+        ix = int(position.x // self.cell_size)
+        iz = int(position.z // self.cell_size)
+        seen_keys = self._query_keys
+        seen_keys.clear()
+        for dx in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                key = self._key(ix + dx, iz + dz)
+                if key in seen_keys: # Hash collision between neighboring cells
+                    continue
+                seen_keys.add(key)
+                bucket = self._buckets.get(key)
+                if bucket:
+                    result.extend(bucket)
+        return result
+
+
 # --- UI Management ---
 class UIManager:
     """Manages the visibility and text of all UI elements."""
     def __init__(self):
+        cfg = game_config # Bound once for all the lookups below
         self.ui_elements = [] # Store all UI elements for easy management
+        self._button_callbacks = {} # Button attribute name -> on_click, see bind_button
+
+        # Separate parents for the menu-style screens and the frequently updated HUD,
+        # so hiding everything is one write per root instead of one per element
+        self.ui_static_root = Entity(parent=camera.ui, name='ui_static_root')
+        self.ui_dynamic_root = Entity(parent=camera.ui, name='ui_dynamic_root')
 
         # Menu UI
         # Scale background to cover the whole screen based on camera's aspect ratio
         self.menu_bg = Entity(model='quad', scale_x=camera.aspect_ratio * 2, scale_y=2,
-                              color=color.black, z=1, parent=camera.ui)
+                              color=color.black, z=1, parent=self.ui_static_root)
         self.title_text = Text("CUBE MAZE ADVENTURE PRO", origin=(0,0), scale=0.1, y=0.3,
-                               color=game_config.COLOR_UI_TITLE, parent=camera.ui)
-        self.start_button = Button(text='Start Game', scale=(0.2,0.1), y=0.1, parent=camera.ui)
-        self.exit_button = Button(text='Exit', scale=(0.2,0.1), y=-0.05, parent=camera.ui)
+                               color=cfg.COLOR_UI_TITLE, parent=self.ui_static_root)
+        self.start_button = self._make_button('start_button', text='Start Game', scale=(0.2,0.1), y=0.1)
+        self.exit_button = self._make_button('exit_button', text='Exit', scale=(0.2,0.1), y=-0.05)
         self.ui_elements.extend([self.menu_bg, self.title_text, self.start_button, self.exit_button])
 
-        # Game Over UI
-        self.win_text = Text('', origin=(0,0), scale=0.1, color=game_config.COLOR_UI_WIN, y=0.15, enabled=False, parent=camera.ui)
-        self.lose_text = Text('', origin=(0,0), scale=0.1, color=game_config.COLOR_UI_LOSE, y=0.15, enabled=False, parent=camera.ui)
-        self.restart_button = Button(text='Restart', scale=(0.2,0.1), y=-0.05, enabled=False, parent=camera.ui)
-        self.back_to_menu_button = Button(text='Main Menu', scale=(0.2,0.1), y=-0.2, enabled=False, parent=camera.ui)
-        self.ui_elements.extend([self.win_text, self.lose_text, self.restart_button, self.back_to_menu_button])
+        # Game Over and Pause Menu UI are built on first use, see _ensure_game_over_ui/_ensure_pause_ui
+        self.game_over_text = None
+        self.restart_button = None
+        self.back_to_menu_button = None
+        self.pause_bg = None
+        self.pause_text = None
+        self.resume_button = None
+        self.pause_to_menu_button = None
+        self.generating_text = None # Shown while a new maze is generated, see show_generating_screen
 
-        # Pause Menu UI
+        # In-game UI (Health Bar)
+        # Background and fill are two quads in one vertex-colored mesh (one node, one draw call).
+        # Local x runs 0..1 from the bar's left edge; the fill sits just in front of the background.
+        bg, fill = cfg.COLOR_UI_HEALTH_BG, cfg.COLOR_UI_HEALTH
+        self._health_bar_vertices = [(0, -0.5, 0), (1, -0.5, 0), (1, 0.5, 0), (0, 0.5, 0),
+                                     (0, -0.5, -0.01), (1, -0.5, -0.01), (1, 0.5, -0.01), (0, 0.5, -0.01)]
+        self.health_bar = Entity(model=Mesh(vertices=list(self._health_bar_vertices),
+                                            triangles=[0, 1, 2, 0, 2, 3, 4, 5, 6, 4, 6, 7],
+                                            colors=[bg, bg, bg, bg, fill, fill, fill, fill], mode='triangle'),
+                                 parent=self.ui_dynamic_root, x=-0.5, y=0.4, scale_x=0.4, scale_y=0.05, enabled=False)
+        self.health_text = Text('HP: 3/3', parent=self.health_bar, x=0.05, y=0, scale=0.07, color=_WHITE, origin_x=-0.5)
+        self.ui_elements.extend([self.health_bar, self.health_text])
+
+        # Element groups per screen, built once instead of on every state transition
+        self._menu_group = (self.menu_bg, self.title_text, self.start_button, self.exit_button)
+        self._game_over_group = () # Filled by _ensure_game_over_ui
+        self._pause_group = () # Filled by _ensure_pause_ui
+        self._generating_group = () # Filled by show_generating_screen
+        self._hud_group = (self.health_bar, self.health_text)
+
+        # Elements whose `enabled` flag is currently True, so hiding only touches those
+        self._currently_enabled = {element for element in self.ui_elements if element.enabled}
+        self._deferred = None # element -> pending enabled state while inside batch_updates()
+        self._deferred_roots = {} # UI root -> pending enabled state while inside batch_updates()
+
+        # Health display cache: last value shown, plus precomputed scale factor and labels
+        self._max_health = cfg.PLAYER_MAX_HEALTH
+        self._inv_max_health = 1.0 / self._max_health
+        self._last_health = None
+        self._hp_strings = [f'HP: {i}/{self._max_health}' for i in range(self._max_health + 1)]
+
+    def _make_button(self, name, **kwargs):
+        """Creates a static-screen Button, wired to any callback already bound to `name`."""
+        button = Button(parent=self.ui_static_root, **kwargs)
+        if name in self._button_callbacks:
+            button.on_click = self._button_callbacks[name]
+        return button
+
+    def bind_button(self, name, callback):
+        """
+        Sets the on_click of the button stored as attribute `name`. Works before
+        a lazily built button exists; it picks the callback up when created.
+        """
+        self._button_callbacks[name] = callback
+        button = getattr(self, name)
+        if button is not None:
+            button.on_click = callback
+
+    def _ensure_game_over_ui(self):
+        """Builds the win/lose screen the first time it is shown."""
+        if self.game_over_text is not None:
+            return
+        # One Text serves both outcomes (they share position, font and style), so the
+        # screen carries a single text node instead of a win and a lose copy
+        self.game_over_text = Text('', origin=(0,0), scale=0.1, y=0.15, enabled=False, parent=self.ui_static_root)
+        self._game_over_is_win = None # Outcome game_over_text currently shows
+        self.restart_button = self._make_button('restart_button', text='Restart', scale=(0.2,0.1), y=-0.05, enabled=False)
+        self.back_to_menu_button = self._make_button('back_to_menu_button', text='Main Menu', scale=(0.2,0.1), y=-0.2, enabled=False)
+        self.ui_elements.extend([self.game_over_text, self.restart_button, self.back_to_menu_button])
+        self._game_over_group = (self.game_over_text, self.restart_button, self.back_to_menu_button)
+
+    def _ensure_pause_ui(self):
+        """Builds the pause menu the first time it is shown."""
+        if self.pause_bg is not None:
+            return
         self.pause_bg = Entity(model='quad', scale_x=camera.aspect_ratio * 2, scale_y=2,
-                               color=color.black50, z=1, parent=camera.ui, enabled=False)
+                               color=color.black50, z=1, parent=self.ui_static_root, enabled=False)
         self.pause_text = Text("PAUSED", origin=(0,0), scale=0.1, y=0.2,
-                               color=color.white, parent=camera.ui, enabled=False)
-        self.resume_button = Button(text='Resume Game', scale=(0.2,0.1), y=0.05, parent=camera.ui, enabled=False)
-        self.pause_to_menu_button = Button(text='Main Menu', scale=(0.2,0.1), y=-0.1, parent=camera.ui, enabled=False)
+                               color=_WHITE, parent=self.ui_static_root, enabled=False)
+        self.resume_button = self._make_button('resume_button', text='Resume Game', scale=(0.2,0.1), y=0.05, enabled=False)
+        self.pause_to_menu_button = self._make_button('pause_to_menu_button', text='Main Menu', scale=(0.2,0.1), y=-0.1, enabled=False)
         self.ui_elements.extend([self.pause_bg, self.pause_text, self.resume_button, self.pause_to_menu_button])
+        self._pause_group = (self.pause_bg, self.pause_text, self.resume_button, self.pause_to_menu_button)
 
-        # In-game UI (Health Bar)
-        self.health_bar_bg = Entity(model='quad', parent=camera.ui, x=-0.5, y=0.4, scale_x=0.4, scale_y=0.05,
-                                    color=game_config.COLOR_UI_HEALTH_BG, enabled=False, origin_x=-0.5)
-        self.health_bar_fill = Entity(model='quad', parent=self.health_bar_bg, x=0, y=0, scale_x=1, scale_y=1,
-                                      color=game_config.COLOR_UI_HEALTH, origin_x=-0.5)
-        self.health_text = Text('HP: 3/3', parent=self.health_bar_bg, x=0.05, y=0, scale=0.07, color=color.white, origin_x=-0.5)
-        self.ui_elements.extend([self.health_bar_bg, self.health_bar_fill, self.health_text])
-
+    @contextmanager
+    def batch_updates(self):
+        """
+        Defers the enable/disable writes made inside the block and applies only
+        each element's final state on exit, so "hide all, then show a screen"
+        touches just the elements (and UI roots) whose visibility actually changes.
+        """
+        if self._deferred is not None:
+            yield # Already batching; the outermost block applies the changes
+            return
+        self._deferred = {}
+        try:
+            yield
+        finally:
+            deferred, self._deferred = self._deferred, None
+            deferred_roots, self._deferred_roots = self._deferred_roots, {}
+            self._set_ui_group_enabled([e for e, state in deferred.items() if not state], False)
+            self._set_ui_group_enabled([e for e, state in deferred.items() if state], True)
+            for root, state in deferred_roots.items():
+                self._set_root_enabled(root, state)
+
+    def _enabled_elements(self):
+        """Elements that are enabled, or will be once the current batch is applied."""
+        deferred = self._deferred
+        if not deferred:
+            return tuple(self._currently_enabled)
+        enabled = self._currently_enabled
+        return tuple(e for e in enabled.union(deferred) if deferred.get(e, e in enabled))
 
     def _set_ui_group_enabled(self, group_elements, state):
-        """Helper to enable/disable a list of UI elements."""
+        """Helper to enable/disable a group of UI elements, skipping ones already in that state."""
+        deferred = self._deferred
+        if deferred is not None:
+            for element in group_elements:
+                deferred[element] = state # Last write wins, applied by batch_updates
+            return
+        # The element's own flag decides; the setter (and its side effects) only runs on a change
+        track = self._currently_enabled.add if state else self._currently_enabled.discard
         for element in group_elements:
-            element.enabled = state
+            if element.enabled is not state:
+                element.enabled = state
+            track(element)
+
+    def _set_root_enabled(self, root, state):
+        """Shows/hides a whole UI root; its children keep their own enabled flags."""
+        if self._deferred is not None:
+            self._deferred_roots[root] = state # Last write wins, applied by batch_updates
+            return
+        if root.enabled is not state:
+            root.enabled = state
+
+    def _show_only(self, group_elements):
+        """Shows a static screen: hides every enabled element outside `group_elements`, then shows the group."""
+        self._set_ui_group_enabled([e for e in self._enabled_elements() if e not in group_elements], False)
+        self._set_ui_group_enabled(group_elements, True)
+        self._set_root_enabled(self.ui_static_root, True)
 
     def show_menu(self):
         """Displays the main menu UI."""
-        self._set_ui_group_enabled(self.ui_elements, False) # Hide all first
-        self._set_ui_group_enabled([self.menu_bg, self.title_text, self.start_button, self.exit_button], True)
+        self._show_only(self._menu_group)
 
     def show_game_over_screen(self, is_win):
         """Displays the win or lose screen UI."""
-        self._set_ui_group_enabled(self.ui_elements, False) # Hide all first
-        if is_win:
-            self.win_text.text = '🎉 You Win!'
-            self.win_text.enabled = True
-        else:
-            self.lose_text.text = '💀 You were caught by the monster!'
-            self.lose_text.enabled = True
-        self._set_ui_group_enabled([self.restart_button, self.back_to_menu_button], True)
+        self._ensure_game_over_ui()
+        if is_win is not self._game_over_is_win: # Only rebuild the text when the outcome changes
+            self._game_over_is_win = is_win
+            if is_win:
+                self.game_over_text.color = game_config.COLOR_UI_WIN
+                self.game_over_text.text = '🎉 You Win!'
+            else:
+                self.game_over_text.color = game_config.COLOR_UI_LOSE
+                self.game_over_text.text = '💀 You were caught by the monster!'
+        self._show_only(self._game_over_group)
 
     def show_pause_menu(self):
         """Displays the pause menu UI."""
-        self._set_ui_group_enabled(self.ui_elements, False) # Hide all first
-        self._set_ui_group_enabled([self.pause_bg, self.pause_text, self.resume_button, self.pause_to_menu_button], True)
+        self._ensure_pause_ui()
+        self._show_only(self._pause_group)
+
+    def show_generating_screen(self):
+        """Displays the "Generating maze..." screen over the menu background."""
+        if self.generating_text is None:
+            self.generating_text = Text("Generating maze...", origin=(0,0), scale=0.07,
+                                        color=_WHITE, parent=self.ui_static_root, enabled=False)
+            self.ui_elements.append(self.generating_text)
+            self._generating_group = (self.menu_bg, self.generating_text)
+        self._show_only(self._generating_group)
 
     def show_game_hud(self):
         """Displays the in-game HUD."""
-        self.health_bar_bg.enabled = True
-        self.health_bar_fill.enabled = True
-        self.health_text.enabled = True
+        self._set_ui_group_enabled(self._hud_group, True)
+        self._set_root_enabled(self.ui_dynamic_root, True)
 
     def hide_all_ui(self):
-        """Hides all UI elements."""
-        self._set_ui_group_enabled(self.ui_elements, False)
+        """
+        Hides all UI by disabling both roots. Element flags are left as they are;
+        the next show_* call diffs them against the screen it shows.
+        """
+        self._set_root_enabled(self.ui_static_root, False)
+        self._set_root_enabled(self.ui_dynamic_root, False)
+
+    def _set_health_fill(self, fraction):
+        """Moves the right edge of the fill quad (vertices 5 and 6) and regenerates the bar mesh."""
+        vertices = self._health_bar_vertices
+        vertices[5] = (fraction, -0.5, -0.01)
+        vertices[6] = (fraction, 0.5, -0.01)
+        mesh = self.health_bar.model
+        mesh.vertices = vertices
+        mesh.generate()
 
     def update_health_display(self, current_health):
-        """Updates the player's health bar and text."""
-        self.health_bar_fill.scale_x = current_health / game_config.PLAYER_MAX_HEALTH
-        self.health_text.text = f'HP: {current_health}/{game_config.PLAYER_MAX_HEALTH}'
+        """Updates the player's health bar and text. No-op if the health shown is unchanged."""
+        if current_health == self._last_health:
+            return # Skip the Text mesh rebuild for unchanged values
+        self._last_health = current_health
+        current_health = min(max(current_health, 0), self._max_health)
+        self._set_health_fill(current_health * self._inv_max_health)
+        self.health_text.text = self._hp_strings[current_health]
 
 
 # --- Main Game Class ---
@@ -673,14 +1240,22 @@ class Game:
         self.player = None
         self.goal = None
         self.monster = None
+        # Common parent for the geometry that never moves: outside ground plane and maze mesh
+        self.static_world = Entity(name='static_world')
         self.maze_generator = TerrainMazeGenerator(
             game_config.MAZE_DIMENSION,
             game_config.CELL_SIZE,
             game_config.MAZE_WALL_HEIGHT,
-            game_config.MAZE_PATH_HEIGHT
+            game_config.MAZE_PATH_HEIGHT,
+            parent=self.static_world
         )
         self.ui_manager = UIManager()
-        self.game_entities = [] # List to manage all game-specific entities (player, goal, monster)
+        self._dynamic_entities = WeakSet() # Game-specific entities other than the player (goal, monster)
+        self._gameplay_root = Entity(name='gameplay_root') # Parent of player, goal and monster
+        self._maze_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='maze_generation')
+        self._maze_future = None # Future of the maze generation in progress, if any
+        self.projectile_pool = ProjectilePool(game_config.MONSTER_PROJECTILE_POOL_SIZE)
+        self.spatial_hash = SpatialHash(game_config.SPATIAL_HASH_CELL_SIZE)
 
         self._setup_global_input()
         self._setup_ui_callbacks()
@@ -695,6 +1270,16 @@ class Game:
         self._original_app_input = app.input # Store original input function
         app.input = self._handle_global_input # Override with our custom handler
 
+        # What Escape does in each state, looked up once per key press
+        to_menu = partial(self.set_game_state, GameState.MENU)
+        self._escape_handlers = {
+            GameState.PLAYING: partial(self.set_game_state, GameState.PAUSED),
+            GameState.PAUSED: partial(self.set_game_state, GameState.PLAYING),
+            GameState.WIN: to_menu, # If on win/lose screen, escape goes back to main menu
+            GameState.LOSE: to_menu,
+            GameState.MENU: application.quit, # Exit application from main menu
+        }
+
     def _handle_global_input(self, key):
         """Processes global input (like Escape for pause/quit)."""
         # First, allow Ursina's default input system to process for entities
@@ -703,29 +1288,26 @@ class Game:
             self._original_app_input(key)
 
         if key == 'escape':
-            if self.current_state == GameState.PLAYING:
-                self.set_game_state(GameState.PAUSED)
-            elif self.current_state == GameState.PAUSED:
-                self.set_game_state(GameState.PLAYING)
-            elif self.current_state in [GameState.WIN, GameState.LOSE]:
-                # If on win/lose screen, escape goes back to main menu
-                self.set_game_state(GameState.MENU)
-            elif self.current_state == GameState.MENU:
-                application.quit() # Exit application from main menu
+            self._escape_handlers[self.current_state]()
 
     def _setup_ui_callbacks(self):
-        """Assigns game functions to UI button click events."""
-        self.ui_manager.start_button.on_click = self.start_game
-        self.ui_manager.exit_button.on_click = application.quit
-        self.ui_manager.restart_button.on_click = self.restart_game
-        self.ui_manager.back_to_menu_button.on_click = self.go_to_main_menu
-        self.ui_manager.resume_button.on_click = lambda: self.set_game_state(GameState.PLAYING)
-        self.ui_manager.pause_to_menu_button.on_click = self.go_to_main_menu
+        """
+        Assigns game functions to UI button click events. Callbacks are bound
+        methods or functools.partial objects rather than lambdas.
+        """
+        bind = self.ui_manager.bind_button # Also covers the lazily built pause/game-over buttons
+        bind('start_button', self.start_game)
+        bind('exit_button', application.quit)
+        bind('restart_button', self.restart_game)
+        bind('back_to_menu_button', self.go_to_main_menu)
+        bind('resume_button', partial(self.set_game_state, GameState.PLAYING))
+        bind('pause_to_menu_button', self.go_to_main_menu)
 
     def _initialize_environment_elements(self):
         """Sets up persistent elements of the scene that are not part of the maze."""
         # This ground plane will act as the 'outside' of the maze.
         self.outside_ground = Entity(
+            parent=self.static_world,
             model='plane',
             scale=game_config.GROUND_SCALE,
             color=game_config.COLOR_OUTSIDE_MAZE,
@@ -736,8 +1318,8 @@ class Game:
             y=game_config.MAZE_PATH_HEIGHT - 0.01 # Slightly below maze paths
         )
         # Adding a simple light source
-        DirectionalLight(direction=(1, -1, 1), color=color.white)
-        AmbientLight(color=color.rgba(100, 100, 100, 10)) # Soft ambient light
+        DirectionalLight(direction=(1, -1, 1), color=_WHITE)
+        AmbientLight(color=_AMBIENT) # Soft ambient light
         Sky() # Adds a simple skybox
 
 
@@ -746,36 +1328,57 @@ class Game:
         if self.current_state == new_state:
             return # No state change
 
-        print(f"Game State Transition: {self.current_state} -> {new_state}")
+        logger.debug("Game State Transition: %s -> %s", self.current_state.name, new_state.name)
         self.current_state = new_state
 
-        # Handle UI visibility based on new state
-        self.ui_manager.hide_all_ui() # Hide all UI first
-        if new_state == GameState.MENU:
-            self.ui_manager.show_menu()
-            self._deactivate_gameplay_entities()
-            self._set_menu_camera()
-            self._unload_game_entities() # Clean up previous game's entities and maze
-        elif new_state == GameState.PLAYING:
-            self.ui_manager.hide_all_ui()
-            self.ui_manager.show_game_hud()
-            self._activate_gameplay_entities()
-            # Player class handles camera parenting on enable
-        elif new_state == GameState.PAUSED:
-            self.ui_manager.show_pause_menu()
-            # Deactivate monster, but keep player (and camera) active for pause screen
-            self._deactivate_gameplay_entities(exclude_player=True)
-            self._set_menu_camera(maintain_player_pos=True) # Keep camera at player's location
-        elif new_state in [GameState.WIN, GameState.LOSE]:
-            self.ui_manager.show_game_over_screen(new_state == GameState.WIN)
-            self._deactivate_gameplay_entities() # Freeze game
-            self._set_game_over_camera()
+        # Handle UI visibility based on new state; batched so only the final visibility is applied
+        with self.ui_manager.batch_updates():
+            self.ui_manager.hide_all_ui() # Hide all UI first
+            if new_state == GameState.MENU:
+                self.ui_manager.show_menu()
+                self._deactivate_gameplay_entities()
+                self._set_menu_camera()
+                self._unload_game_entities() # Clean up previous game's entities and maze
+            elif new_state == GameState.PLAYING:
+                self.ui_manager.show_game_hud()
+                self._activate_gameplay_entities()
+                # Player class handles camera parenting on enable
+            elif new_state == GameState.PAUSED:
+                self.ui_manager.show_pause_menu()
+                # Deactivate monster, but keep player (and camera) active for pause screen.
+                # In-flight projectiles are frozen rather than cleared, and resume on unpause.
+                self._deactivate_gameplay_entities(exclude_player=True, freeze_projectiles=True)
+                self._set_menu_camera(maintain_player_pos=True) # Keep camera at player's location
+            elif new_state >= GameState.WIN: # WIN or LOSE
+                self.ui_manager.show_game_over_screen(new_state == GameState.WIN)
+                self._deactivate_gameplay_entities() # Freeze game
+                self._set_game_over_camera()
 
 
     def start_game(self):
-        """Initializes/resets game entities and sets state to PLAYING."""
-        # Generate a new maze each time the game starts
-        self.maze_generator.generate_random_maze()
+        """
+        Starts generating a new maze on a worker thread behind a "Generating maze..."
+        screen. Game.update picks up the finished grid and calls _finish_start_game.
+        """
+        if self._maze_future is not None:
+            return # A maze is already being generated
+        # Ursina objects are only touched here, on the main thread
+        self.maze_generator.clear_maze()
+        self.ui_manager.show_generating_screen()
+        self._maze_future = self._maze_executor.submit(self.maze_generator.generate_maze_grid)
+
+    def _finish_start_game(self, future):
+        """
+        Installs the grid from the finished generation `future`, builds the maze mesh,
+        initializes/resets game entities and sets state to PLAYING.
+        """
+        error = future.exception()
+        if error is not None or not future.result():
+            logger.error("Maze generation failed, returning to the main menu", exc_info=error)
+            self._abort_start_game()
+            return
+        self.maze_generator.set_maze_grid(future.result())
+        self.maze_generator.build_maze_mesh()
 
         # Determine spawn points based on the new maze
         player_grid_pos = self.maze_generator.find_spawn_point()
@@ -789,28 +1392,34 @@ class Game:
 
         # Create or reset entities
         if self.player is None:
-            self.player = Player(position=player_world_pos)
-            self.game_entities.append(self.player)
+            self.player = Player(position=player_world_pos, parent=self._gameplay_root)
         else:
             self.player.start_position = player_world_pos # Update start position for new maze
             self.player.reset_state() # Resets position, health, and enables
 
         if self.goal is None:
-            self.goal = Goal(position=goal_world_pos)
-            self.game_entities.append(self.goal)
+            self.goal = Goal(position=goal_world_pos, parent=self._gameplay_root)
+            self._dynamic_entities.add(self.goal)
         else:
-            self.goal.position = goal_world_pos # Update position for new maze
-            self.goal.reset_state() # Resets state (e.g., visibility)
+            self.goal.start_position = goal_world_pos # Update start position for new maze
+            self.goal.reset_state() # Resets position and visibility
 
         if self.monster is None:
-            self.monster = Monster(position=monster_world_pos)
-            self.game_entities.append(self.monster)
+            self.monster = Monster(position=monster_world_pos, parent=self._gameplay_root)
+            self._dynamic_entities.add(self.monster)
         else:
             self.monster.start_position = monster_world_pos # Update start position for new maze
             self.monster.reset_state() # Resets position and enables
 
         self.set_game_state(GameState.PLAYING)
 
+    def _abort_start_game(self):
+        """Replaces the "Generating maze..." screen with the main menu."""
+        if self.current_state == GameState.MENU:
+            self.ui_manager.show_menu() # Already in MENU, only the screen needs swapping
+        else:
+            self.set_game_state(GameState.MENU)
+
     def restart_game(self):
         """Restarts the current game by regenerating maze and resetting entities."""
         self.start_game() # Calling start_game handles all setup for a new game
@@ -819,41 +1428,52 @@ class Game:
         """Transitions from game over/pause to the main menu."""
         self.set_game_state(GameState.MENU)
 
+    def acquire_projectile(self, position, direction):
+        """Launches a pooled projectile from `position` along `direction` and returns it."""
+        projectile = self.projectile_pool.acquire()
+        projectile.spawn(position, direction)
+        return projectile
+
     def _unload_game_entities(self):
         """Destroys all dynamic game entities (player, monster, goal) and the maze mesh."""
-        for entity in self.game_entities:
-            if entity: # Check if entity exists before destroying
-                destroy(entity)
-        self.game_entities.clear() # Clear the list after destroying
+        # Player, goal and monster all hang off _gameplay_root, so one destroy takes them all
+        destroy(self._gameplay_root)
+        self._gameplay_root = Entity(name='gameplay_root')
+        self._maze_future = None # Drop a maze generation still in flight; its grid is never used
+        # Entities drop out of the WeakSet once collected, but destroyed Entities can sit in
+        # reference cycles until the cycle collector runs, so empty it right away
+        self._dynamic_entities.clear()
         self.player = None # Clear references to destroyed entities
         self.goal = None
         self.monster = None
         self.maze_generator.clear_maze() # Clear the maze mesh
 
-        # Also destroy any active projectiles if they exist
-        for p in [e for e in scene.entities if isinstance(e, MonsterProjectile)]:
-            destroy(p)
+        # Also return any active projectiles to the pool (the pool outlives a game)
+        self.projectile_pool.release_all()
 
 
     def _activate_gameplay_entities(self):
         """Enables visibility and updates for game entities relevant during PLAYING state."""
         # Player.on_enable handles camera parenting and mouse lock
-        for entity in self.game_entities:
-            if entity:
-                entity.enabled = True
+        if self.player:
+            self.player.enabled = True
+        for entity in self._dynamic_entities:
+            entity.enabled = True
         if self.maze_generator.mesh_entity:
             self.maze_generator.mesh_entity.enabled = True
+        self.projectile_pool.set_frozen(False) # Resume projectiles frozen by a pause
 
-    def _deactivate_gameplay_entities(self, exclude_player=False):
+    def _deactivate_gameplay_entities(self, exclude_player=False, freeze_projectiles=False):
         """
         Disables visibility and updates for game entities.
         If exclude_player is True, player remains active (e.g., for pause menu).
+        If freeze_projectiles is True, in-flight projectiles are disabled but kept
+        for resuming; otherwise they are returned to the pool.
         """
-        for entity in self.game_entities:
-            if entity == self.player and exclude_player:
-                continue # Skip player if excluded
-            if entity:
-                entity.enabled = False # This disables their update method and visibility
+        for entity in self._dynamic_entities:
+            entity.enabled = False # This disables their update method and visibility
+        if self.player and not exclude_player:
+            self.player.enabled = False
 
         if self.maze_generator.mesh_entity:
             # Maze mesh might not need to be disabled if it's part of the background,
@@ -861,9 +1481,12 @@ class Game:
             # For this context, keeping it enabled is fine as it's static.
             pass
 
-        # Destroy any active projectiles immediately when game stops
-        for p in [e for e in scene.entities if isinstance(e, MonsterProjectile)]:
-            destroy(p)
+        if freeze_projectiles:
+            self.projectile_pool.set_frozen(True)
+            return
+
+        # Return any active projectiles to the pool immediately when game stops
+        self.projectile_pool.release_all()
 
     def _set_menu_camera(self, maintain_player_pos=False):
         """
@@ -873,7 +1496,7 @@ class Game:
         camera.parent = None
         if maintain_player_pos and self.player:
             # Position camera slightly above and behind player for pause view
-            camera.position = self.player.position + Vec3(0, 5, -10)
+            camera.position = self.player.position + _PAUSE_CAM_OFFSET
             camera.look_at(self.player.position) # Look at player
             # Adjust rotation if needed for a better static view
             camera.rotation_x += 10 # Tilt down slightly
@@ -891,12 +1514,41 @@ class Game:
 
     def update(self):
         """Main game loop update function."""
+        future = self._maze_future
+        if future is not None and future.done():
+            self._maze_future = None
+            self._finish_start_game(future) # Background maze generation finished
+
         # Global game logic that doesn't belong to a specific entity
-        pass
+        if self.current_state != GameState.PLAYING:
+            return
+        # Runs before entity updates: release projectiles retired last frame
+        self.projectile_pool.sweep()
+        self._resolve_projectile_hits()
+
+    def _resolve_projectile_hits(self):
+        """
+        Rebuilds the spatial hash from live projectiles and runs the precise
+        hit test only for projectiles in the player's neighborhood.
+        """
+        player = self.player
+        if player is None or not player.enabled:
+            return
+
+        spatial_hash = self.spatial_hash
+        spatial_hash.clear()
+        for projectile in self.projectile_pool.active:
+            spatial_hash.insert(projectile)
+
+        for projectile in spatial_hash.query(player.position):
+            projectile.try_hit(player)
+            if self.current_state != GameState.PLAYING:
+                break # The hit ended the game and cleared the projectiles
 
 
 # --- Application Setup ---
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING) # Raise to DEBUG to trace state transitions and damage
     app = Ursina()
 
     # Global game configuration instance
@@ -912,5 +1564,9 @@ if __name__ == '__main__':
     window.exit_button.visible = False # Managed by our input handler
     window.fps_counter.enabled = game_config.WINDOW_FPS_COUNTER
 
+    # Ursina calls the main script's update() every frame; forward it to the game
+    def update():
+        game.update()
+
     # Run the Ursina application
     app.run()
\ No newline at end of file